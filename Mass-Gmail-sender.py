@@ -19,28 +19,37 @@ Date: 2025-07-06
 Version: 1.0
 
 Requirements:
-- Python 3.8+
+- Python 3.10+
 - Chrome browser
 - Valid Gmail accounts
 - Excel files with account and recipient data
 """
 
-import re
+import io
 import os
 import sys
+import csv
 import time
+import queue
+import signal
 import cutie
-import pandas
-import random
-import string
+import base64
 import logging
+import secrets
+import smtplib
+import openpyxl
 import platform
 import datetime
+import itertools
 from seleniumbase import SB
-from functools import partial
-from multiprocessing import Lock
+from typing import NamedTuple
+from collections import Counter
+from dataclasses import dataclass
+from functools import partial, wraps
+from threading import Lock, Event, Thread, local, get_ident
+from email.message import EmailMessage
 from configparser import RawConfigParser
-from multiprocessing.pool import ThreadPool
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.wait import WebDriverWait
@@ -52,6 +61,12 @@ from selenium.common.exceptions import (
     WebDriverException, ElementNotInteractableException
 )
 
+# Pillow is optional, error screenshots are saved as full PNGs without it
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 
 ####################################################################################
 # ---------------------------------Settings----------------------------------------#
@@ -73,11 +88,103 @@ COMMON_EXCEPTIONS = (
 )
 CLEAR = "cls" if platform.system().upper() == "WINDOWS" else "clear"
 _LIMIT_TRACK_FILE = "daily_limit.csv"
+_SENT_LOG_FILE = "sent.log"
+_LIMIT_REACHED_TEXT = "limit for sending"  # Shown by Gmail once an account hits its daily quota
+_SEND_ATTEMPTS = 2  # Tries per recipient batch before it is given up
+_WORKER = local()  # Per sending thread: the account bound to that thread
 _FOLDER_CONTAINING_ALL_PROFILES = "GmailProfiles"
 _FOLDER_CONTAINING_SCREENSHOTS = "ErrorScreenshots"
-_PORT = 9223  # Starting port for Chrome debugging
+_PORT_SEQ = itertools.count(9223)  # Chrome debugging ports; next() is atomic, no lock needed
+# Chrome switches used by BrowserHandler.start_chrome(light_mode=True); SeleniumBase
+# splits chromium_arg on commas, so each switch must be comma-free
+_LIGHT_MODE_CHROME_ARGS = (
+    "--blink-settings=imagesEnabled=false", "--disable-gpu", "--disable-extensions",
+    "--disable-dev-shm-usage", "--no-sandbox", "--disable-background-networking",
+    "--disable-sync", "--disable-translate", "--disable-features=Translate", "--mute-audio",
+    "--disable-notifications"
+)
+_LIGHT_MODE_BLOCKED_URLS = [  # Analytics, avatars and image CDNs Gmail pulls in on compose
+    "*google-analytics.com*", "*doubleclick.net*", "*gstatic.com/images/*",
+    "*googleusercontent.com/a/*", "*/mail/u/0/s/*avatar*"
+]
+_SCREENSHOT_LIMIT = 20  # Error screenshots per run, later errors are only logged
+_SCREENSHOT_COUNT = itertools.count(1)
+_SCREENSHOT_WRITER = ThreadPoolExecutor(max_workers=2)  # Writes error screenshots off the worker threads
 _CONFIG = RawConfigParser()
 _CONFIG.read("settings.cfg")
+_IS_TTY = sys.stdout.isatty()  # Progress animation is skipped when output is redirected
+_SHUTDOWN = Event()  # Set on Ctrl-C, wakes every wait_until loop at once
+_WAITING = {}  # Thread id -> message of the wait_until loop it is in, shown by report_progress
+
+# Polled by GmailAccount.wait_until_gmail_logged_in to read the login state in one call
+LOGIN_STATE_JS = """
+const find = selector => document.querySelector(selector);
+const heading = find("#headingText");
+const notNow = find("div[aria-live=polite]") && [...document.querySelectorAll("button")].find(
+    button => ["not now", "pas maintenant"].some(label => button.innerText.toLowerCase().includes(label))
+);
+return {
+    disabled: !!heading && heading.innerText.includes("Your account has been disabled"),
+    challenge: !!find("input[name=challengeListId]"),
+    notNow: notNow || null,
+    loggedIn: !!find("a[href=personal-info]")
+};
+"""
+
+# Polled by GmailAccount.wait_until_email_sent to read the send state in one call
+SEND_STATE_JS = """
+const alert = document.querySelector("div[role=alert]");
+return {
+    sent: !!alert && alert.innerText.includes("sent"),
+    sendButton: !!document.querySelector("div[role=button][aria-label*=Ctrl-Enter]")
+};
+"""
+
+# Shared by the compose scripts below: synthetic clicks and polling until a
+# 30s deadline, after which the script resolves with a falsy value
+COMPOSE_HELPERS_JS = """
+const done = arguments[arguments.length - 1];
+const find = selector => document.querySelector(selector);
+const press = el => ["mousedown", "mouseup", "click"].forEach(
+    name => el.dispatchEvent(new MouseEvent(name, {bubbles: true}))
+);
+const sendButton = "div[role=button][aria-label*=Ctrl-Enter]";
+const recipientInput = "input[aria-haspopup=listbox]";
+const deadline = Date.now() + 30000;
+const until = (check, next) => {
+    if (check()) return next();
+    if (Date.now() > deadline) return done(null);
+    setTimeout(() => until(check, next), 250);
+};
+"""
+
+# Injected by GmailAccount.send_emails: opens the compose window, and the Bcc
+# field when asked, then resolves with the [to, bcc] recipient inputs
+OPEN_COMPOSE_JS = COMPOSE_HELPERS_JS + """
+const withBcc = arguments[0];
+press(find("div[role=navigation] > div:first-child div[style*=user-select]"));
+until(() => find(recipientInput) && find("div[role=textbox]"), () => {
+    if (!withBcc) return done([find(recipientInput), null]);
+    press(find("span[role=link][data-tooltip*=Ctrl-Shift-B]"));
+    until(() => document.querySelectorAll(recipientInput).length > 1, () => {
+        const inputs = document.querySelectorAll(recipientInput);
+        done([inputs[0], inputs[inputs.length - 1]]);
+    });
+});
+"""
+
+# Injected by GmailAccount.send_emails once the recipients are entered: fills
+# subject and body, sends, and resolves true when the compose window closes
+SEND_COMPOSED_JS = COMPOSE_HELPERS_JS + """
+const [subject, html] = arguments;
+const subjectInput = find("input[name=subjectbox]");
+subjectInput.focus();
+subjectInput.value = subject;
+subjectInput.dispatchEvent(new Event("input", {bubbles: true}));
+find("div[role=textbox]").innerHTML = html;
+press(find(sendButton));
+until(() => !find(sendButton), () => done(true));
+"""
 
 # Logging configuration
 LOGGER = logging.getLogger("gmail_email_sender")
@@ -89,10 +196,79 @@ logging.basicConfig(
 LOGGER.setLevel(logging.DEBUG)
 
 
+class AccountRow(NamedTuple):
+    """Gmail account credentials read from the accounts sheet."""
+    email: str
+    password: str
+    recovery_email: str
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Configuration resolved once from settings.cfg.
+    
+    Read at startup and passed to the functions that need it, so hot loops
+    use plain attributes instead of parsing config strings on every access.
+    """
+    emails_excel_file: str
+    email_col: str
+    pass_col: str
+    recovery_email_col: str
+    start_index: int
+    end_index: int
+    recipient_emails_excel: str
+    recipient_email_col: str
+    recipient_start: int
+    recipient_end: int
+    email_subject: str
+    email_html_file: str
+    recipients_per_email: int
+    parallel_browsers: int
+    use_smtp: bool
+    smtp_host: str
+    smtp_port: int
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build settings from a parsed configuration.
+        
+        Args:
+            config (RawConfigParser): Parsed settings.cfg
+            
+        Returns:
+            Settings: Resolved settings
+        """
+        return cls(
+            emails_excel_file=config["GMAIL_ACCOUNTS"]["emails_excel_file"],
+            email_col=config["GMAIL_ACCOUNTS"]["email_col"],
+            pass_col=config["GMAIL_ACCOUNTS"]["pass_col"],
+            recovery_email_col=config["GMAIL_ACCOUNTS"]["recovery_email_col"],
+            start_index=config.getint("GMAIL_ACCOUNTS", "start_index"),
+            end_index=config.getint("GMAIL_ACCOUNTS", "end_index"),
+            recipient_emails_excel=config["RECIPIENT"]["recipient_emails_excel"],
+            recipient_email_col=config["RECIPIENT"]["email_col"],
+            recipient_start=config.getint("RECIPIENT", "start_index"),
+            recipient_end=config.getint("RECIPIENT", "end_index"),
+            email_subject=config["EMAIL_INFO"]["email_subject"],
+            email_html_file=config["EMAIL_INFO"]["email_html_file"],
+            recipients_per_email=max(1, config.getint("EMAIL_INFO", "recipients_per_email", fallback=1)),
+            parallel_browsers=config.getint("BROWSER", "parallel_browsers"),
+            use_smtp=config.getboolean("SMTP", "use_smtp", fallback=False),
+            smtp_host=config.get("SMTP", "host", fallback="smtp.gmail.com"),
+            smtp_port=config.getint("SMTP", "port", fallback=587)
+        )
+
+
 ####################################################################################
 # ---------------------------------Decorators--------------------------------------#
 ####################################################################################
 
+def _noop():
+    """Default callback for wait_until hooks."""
+
+
 def exceptional_handler(func):
     """
     Decorator to handle common Selenium exceptions with retry logic.
@@ -101,25 +277,20 @@ def exceptional_handler(func):
         func: Function to be decorated
         
     Returns:
-        Wrapped function with exception handling and retry mechanism
+        Wrapped function with exception handling and retry mechanism;
+        it accepts an extra max_retries keyword (default 2 attempts)
     """
-    def wrapper(*args, **kwargs):
-        retry = kwargs.get("retry", 0)
-        max_retries = kwargs.get("max_retries", 2)
+    @wraps(func)
+    def wrapper(*args, max_retries=2, **kwargs):
+        for attempt in range(max_retries):
+            try:
+                return func(*args, **kwargs)
+            except COMMON_EXCEPTIONS:
+                # Exponential backoff capped at 2s (0.5s, 1s, 2s, 2s...)
+                if attempt + 1 < max_retries:
+                    time.sleep(min(0.5 * 2 ** attempt, 2))
         
-        if retry >= max_retries:
-            raise TimeoutException("Maximum retries reached!")
-        
-        try:
-            # Remove retry parameters from kwargs before calling function
-            if "retry" in kwargs:
-                kwargs.pop("retry")
-            if "max_retries" in kwargs:
-                kwargs.pop("max_retries")
-            return func(*args, **kwargs)
-        except COMMON_EXCEPTIONS:
-            time.sleep(5)
-            return wrapper(retry=retry + 1, max_retries=max_retries, *args, **kwargs)
+        raise TimeoutException("Maximum retries reached!")
     return wrapper
 
 
@@ -134,41 +305,52 @@ def wait_until(condition_func):
         Wrapped function with waiting logic
     """
     def wrapper(*args, **kwargs):
+        # Resolve options and callbacks once, outside the polling loop
+        in_loop_before = kwargs.get("in_loop_before") or _noop
+        in_loop_after = kwargs.get("in_loop_after") or _noop
+        after_loop = kwargs.get("after_loop") or _noop
+        max_attempts = kwargs.get("max_tries", -1)
+        message = kwargs.get("message", "Waiting")
+        sleep = kwargs.get("sleep", 0.5)
+        
         # Execute pre-loop callback
-        kwargs.get("before_loop", lambda: True)()
+        (kwargs.get("before_loop") or _noop)()
         
-        max_attempts = kwargs.get("max_tries", -1)
-        dots = 1
         attempt = 0
         not_completed = False
         
-        while True:
-            # Execute in-loop pre-condition callback
-            kwargs.get("in_loop_before", lambda: True)()
-            
-            # Check condition
-            if condition_func(*args):
-                break
-            
-            # Check max attempts
-            if max_attempts != -1 and attempt >= max_attempts:
-                not_completed = True
-                break
-            
-            attempt += 1
-            
-            # Display waiting message with animated dots
-            print(f"{kwargs.get('message', 'Waiting')}{'.' * dots}", end="\r")
-            dots = 1 if dots > 2 else dots + 1
-            
-            # Execute in-loop post-condition callback
-            kwargs.get("in_loop_after", lambda: True)()
-            
-            time.sleep(kwargs.get("sleep", 0.5))
-            print(" " * 100, end="\r")  # Clear line
+        # Progress is printed by the single report_progress thread
+        thread_id = get_ident()
+        _WAITING[thread_id] = message
+        
+        try:
+            while True:
+                # Execute in-loop pre-condition callback
+                in_loop_before()
+                
+                # Check condition
+                if condition_func(*args):
+                    break
+                
+                # Check max attempts
+                if max_attempts != -1 and attempt >= max_attempts:
+                    not_completed = True
+                    break
+                
+                attempt += 1
+                
+                # Execute in-loop post-condition callback
+                in_loop_after()
+                
+                # Sleep, waking early on shutdown
+                if _SHUTDOWN.wait(sleep):
+                    not_completed = True
+                    break
+        finally:
+            _WAITING.pop(thread_id, None)
         
         # Execute post-loop callback
-        kwargs.get("after_loop", lambda: True)()
+        after_loop()
         return not not_completed
     return wrapper
 
@@ -219,54 +401,31 @@ class BrowserHandler:
             condition = ec.element_to_be_clickable
         return self.wait.until(condition((By.CSS_SELECTOR, css_selector)))
 
-    def find_elements(self, css_selector: str, reference_element=None):
-        """
-        Find elements without waiting (immediate search).
-        
-        Args:
-            css_selector (str): CSS selector to find elements
-            reference_element: Element to search within (default: driver)
-            
-        Returns:
-            List of WebElements
-        """
-        reference = self.driver if reference_element is None else reference_element
-        return reference.find_elements(By.CSS_SELECTOR, css_selector)
-
-    def get_element_by_text(self, text: str, css_selector: str = None, elements=None):
-        """
-        Find element by its text content.
-        
-        Args:
-            text (str): Text to search for
-            css_selector (str): CSS selector to get elements
-            elements: Pre-found elements to search through
-            
-        Returns:
-            WebElement containing the text or None
-        """
-        if elements is None:
-            elements = self.get_element(css_selector, multiple=True)
-        
-        elements_text = self.get_text(element=elements, multiple=True)
-        for element_text in elements_text:
-            if text.lower() in element_text.lower():
-                return elements[elements_text.index(element_text)]
-        return None
-
     @exceptional_handler
     def write(self, css_selector: str, data: str, enter=False):
         """
-        Type text into an input element.
+        Fill an input element with text.
+        
+        The value is set in one script call instead of typing it key by key,
+        send_keys is only used when the page rejects the injected value.
         
         Args:
             css_selector (str): CSS selector for input element
-            data (str): Text to type
-            enter (bool): Press Enter after typing
+            data (str): Text to write
+            enter (bool): Press Enter after writing
         """
         input_el = self.get_element(css_selector, by_clickable=True)
-        input_el.clear()
-        input_el.send_keys(data)
+        filled = self.driver.execute_script(
+            "const el = arguments[0]; el.focus(); el.value = arguments[1];"
+            "['input', 'change'].forEach(e => el.dispatchEvent(new Event(e, {bubbles: true})));"
+            "return el.value === arguments[1]",
+            input_el, data
+        )
+        if not filled:
+            input_el.clear()
+            input_el.send_keys(data)
+        
+        # A real key press, Gmail listens for the Enter keydown
         if enter:
             input_el.send_keys(Keys.ENTER)
 
@@ -275,52 +434,56 @@ class BrowserHandler:
         """
         Click on an element with optional scrolling.
         
+        A selector is waited on until clickable; an element passed directly
+        is only waited on if it had to be scrolled into view.
+        
         Args:
             css_selector (str): CSS selector for element to click
             element: WebElement to click directly
-            scroll (bool): Scroll element into view before clicking
+            scroll (bool | str): Scroll element into view before clicking,
+                "auto" scrolls only if it is outside the viewport
         """
         if css_selector is not None:
             element = self.get_element(css_selector, by_clickable=True)
         
-        if scroll:
+        if scroll == "auto":
+            scrolled = self.driver.execute_script(
+                "const r = arguments[0].getBoundingClientRect();"
+                "if (r.top >= 0 && r.bottom <= innerHeight) return false;"
+                "arguments[0].scrollIntoView({block: 'center'}); return true",
+                element
+            )
+        elif scroll:
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center'})", element
             )
+            scrolled = True
+        else:
+            scrolled = False
         
-        time.sleep(1)
-        element.click()
-
-    @exceptional_handler
-    def get_text(self, css_selector=None, element=None, multiple=False):
-        """
-        Get text content from element(s).
-        
-        Args:
-            css_selector (str): CSS selector for element
-            element: WebElement to get text from
-            multiple (bool): Get text from multiple elements
-            
-        Returns:
-            String or list of strings
-        """
-        if css_selector is not None:
-            element = self.get_element(css_selector, multiple=multiple)
+        # Wait for an element handed in directly to settle after scrolling
+        if scrolled and css_selector is None:
+            self.wait.until(ec.element_to_be_clickable(element))
         
-        if not multiple:
-            return element.get_property("innerText")
-        return [el.get_property("innerText") for el in element]
+        element.click()
 
-    def start_chrome(self, headless: bool = False, **kwargs) -> None:
+    def start_chrome(self, headless: bool = False, light_mode: bool = False, **kwargs) -> None:
         """
         Start Chrome browser with SeleniumBase.
         
         Args:
             headless (bool): Run browser in headless mode
+            light_mode (bool): Block images, turn off Chrome subsystems that
+                scripted sending does not need and return from navigations at
+                DOMContentLoaded, to cut memory and time per browser
             **kwargs: Additional arguments for browser configuration
         """
-        kwargs["chromium_arg"] = f'{kwargs.get("chromium_arg", "")},' \
-                                f'--remote-debugging-port={self.port}'.strip(",")
+        chromium_args = [kwargs.get("chromium_arg", ""), f"--remote-debugging-port={self.port}"]
+        if light_mode:
+            chromium_args.extend(_LIGHT_MODE_CHROME_ARGS)
+            kwargs["block_images"] = True
+            kwargs.setdefault("page_load_strategy", "eager")
+        kwargs["chromium_arg"] = ",".join(arg for arg in chromium_args if arg)
         
         sb_init = SB(
             uc=True, 
@@ -334,7 +497,21 @@ class BrowserHandler:
         self.sb_init = sb_init
         self.driver = self.seleniumbase_driver.driver
         self.wait = WebDriverWait(self.driver, 40)
-        self.driver.set_page_load_timeout(300)
+        self.driver.set_script_timeout(60)
+        self.driver.set_page_load_timeout(60)  # Fail fast on hung pages
+        
+        # Drop requests scripted sending never needs before the first navigation
+        if light_mode:
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _LIGHT_MODE_BLOCKED_URLS})
+            except (AttributeError, WebDriverException):
+                # Driver without CDP support
+                pass
+        
+        # No implicit wait: every wait for an element goes through WebDriverWait,
+        # so failed polls inside an explicit wait return immediately
+        self.driver.implicitly_wait(0)
 
     def kill_browser(self) -> None:
         """Close browser and clean up resources."""
@@ -344,7 +521,6 @@ class BrowserHandler:
         self.driver.quit()
         self.sb_init.__exit__(None, None, None)
         self.driver = None
-        time.sleep(5)
 
 
 ############################################################################################
@@ -367,40 +543,31 @@ class GmailAccount(BrowserHandler):
             email (str): Gmail address
             password (str): Account password
             recovery_email (str): Recovery email for verification
-            **kwargs: Additional browser configuration
+            **kwargs: Additional browser configuration (light_mode, port)
         """
         # Set profile path based on email username
         kwargs["temp_profile"] = os.path.abspath(f'GmailProfiles/{email.split("@")[0]}')
+        light_mode = kwargs.pop("light_mode", False)
         super().__init__(**kwargs)
         
-        # Start browser and set window size
-        self.start_chrome()
-        self.driver.set_window_size(1280, 720)
+        # Start browser, sized at launch so no resize call is needed
+        self.start_chrome(light_mode=light_mode, window_size="1280,720")
         
         # Store account credentials
         self.email = email
         self.password = password
         self.recovery_email = recovery_email
+        self.limit_reached = False
 
-    @wait_until
     def wait_until_loaded(self):
         """
         Wait until Gmail login page is loaded.
         
         Returns:
-            bool: True if page is loaded, False otherwise
+            bool: True if already logged in, False if the login form is shown
         """
-        try:
-            # Check for login identifier field
-            if self.find_elements("[name=identifier]"):
-                return True
-            # Check if already logged in
-            elif self.find_elements("a[href=personal-info]"):
-                self.driver.execute_script("alert('Logged In')")
-                return True
-        except:
-            pass
-        return False
+        element = self.get_element("[name=identifier], a[href=personal-info]")
+        return element.get_attribute("name") != "identifier"
         
     @wait_until
     def wait_until_gmail_logged_in(self, recovery_email):
@@ -414,31 +581,25 @@ class GmailAccount(BrowserHandler):
             bool: True if login successful, False otherwise
         """
         try:
+            # Probe every login state in one driver call
+            state = self.driver.execute_script(LOGIN_STATE_JS)
+            
             # Check if account is disabled
-            if (self.find_elements("#headingText") and 
-                "Your account has been disabled" in self.get_text("#headingText")):
+            if state["disabled"]:
                 self.driver.execute_script("alert('Account Disabled')")
                 return True
             
             # Handle account verification challenge
-            elif self.find_elements("input[name=challengeListId]"):
-                self.click_element("section ul li:nth-child(3)")
+            elif state["challenge"]:
+                self.click_element("section ul li:nth-child(3)", scroll="auto")
                 self.write("input[type=email]", recovery_email, enter=True)
             
-            # Handle "Not now" dialog (English)
-            elif self.find_elements("div[aria-live=polite]"):
-                button_element = self.get_element_by_text("not now", "button")
-                if button_element is not None:
-                    self.click_element(element=button_element)
-            
-            # Handle "Not now" dialog (French)
-            elif self.find_elements("div[aria-live=polite]"):
-                button_element = self.get_element_by_text("Pas maintenant", "button")
-                if button_element is not None:
-                    self.click_element(element=button_element)
+            # Handle "Not now" dialog (English or French), the probe returns its button
+            elif state["notNow"]:
+                self.click_element(element=state["notNow"], scroll=False)
             
             # Check if successfully logged in
-            elif self.find_elements("a[href=personal-info]"):
+            elif state["loggedIn"]:
                 return True
                 
         except:
@@ -454,11 +615,9 @@ class GmailAccount(BrowserHandler):
         try:
             # Navigate to Google accounts page
             self.driver.get("https://accounts.google.com/")
-            self.wait_until_loaded()
             
-            # Handle alert if already logged in
-            if ec.alert_is_present()(self.driver):
-                self.driver.switch_to.alert.accept()
+            # Nothing to do if the profile is already logged in
+            if self.wait_until_loaded():
                 return True
             
             # Enter email and password
@@ -471,6 +630,10 @@ class GmailAccount(BrowserHandler):
                 message="Waiting until gmail logged in"
             )
             
+            # Ctrl-C ended the wait before the login finished
+            if _SHUTDOWN.is_set():
+                return False
+            
             # Check if account is disabled
             if ec.alert_is_present()(self.driver):
                 self.driver.switch_to.alert.accept()
@@ -480,6 +643,9 @@ class GmailAccount(BrowserHandler):
             return True
             
         except COMMON_EXCEPTIONS:
+            # Failures while stopping are expected, not login errors
+            if _SHUTDOWN.is_set():
+                return False
             logging_error_screenshot(f"Cannot login {self.email}!", self.driver)
             return False
     
@@ -492,77 +658,77 @@ class GmailAccount(BrowserHandler):
             bool: True if email sent, False otherwise
         """
         try:
+            # Probe the success alert and the send button in one driver call
+            state = self.driver.execute_script(SEND_STATE_JS)
+            
             # Check for success alert
-            alert = self.find_elements("div[role=alert]")
-            if alert and ("sent" in self.get_text(element=alert[0])):
+            if state["sent"]:
                 return True
             
             # Click send button if still visible
-            elif self.find_elements("div[role=button][aria-label*=Ctrl-Enter]"):
-                self.click_element("div[role=button][aria-label*=Ctrl-Enter]")
+            elif state["sendButton"]:
+                self.click_element("div[role=button][aria-label*=Ctrl-Enter]", scroll=False)
                 return False
                 
         except COMMON_EXCEPTIONS:
             return False
                                                       
-    def send_emails(self, to, subject):
+    def send_emails(self, to, subject, body):
         """
-        Send email to specified recipient.
+        Send one email to a batch of recipients.
         
         Args:
-            to (str): Recipient email address
+            to (list): Recipient email addresses
             subject (str): Email subject line
+            body (str): HTML content of the email
+            
+        Returns:
+            bool: True if email sent, False otherwise
         """
         try:
-            LOGGER.info(f"Sending email to {to} from {self.email}")
+            LOGGER.info(f"Sending email to {', '.join(to)} from {self.email}")
             
             # Navigate to Gmail if not already there
             if "https://mail.google.com/mail/u/0/" not in self.driver.current_url:
                 self.driver.get("https://mail.google.com/mail/u/0/")
             
             # Wait for Gmail to load
-            wait_until(lambda: self.find_elements(
-                "div[role=navigation] > div:first-child div[style*=user-select]"
-            ))(message="Waiting until loaded")
-            
-            # Close any open dialogs
-            while self.find_elements("div[role=dialog] td > img:last-child"):
-                self.click_element("div[role=dialog] td > img:last-child")
-            
-            # Click compose button
-            self.click_element("div[role=navigation] > div:first-child div[style*=user-select]")
+            self.get_element("div[role=navigation] > div:first-child div[style*=user-select]")
             
-            # Fill recipient field
-            self.write("input[aria-haspopup=listbox]", to, enter=True)
-            
-            # Fill subject field
-            self.write("input[name=subjectbox]", subject)
-            
-            # Fill email body with HTML content
-            email_inp = self.get_element("div[role=textbox]")
-            with open(_CONFIG["EMAIL_INFO"]["email_html_file"], "r", encoding="utf-8") as f:
-                html_data = f.read()
-            
-            # Extract body content from HTML
-            body = re.findall("(?<=<body>).*(?=</body>)", html_data)
-            html_data = body[0] if body else html_data
-            
-            # Insert HTML content into email body
-            self.driver.execute_script(
-                "arguments[0].innerHTML = arguments[1]", 
-                email_inp, 
-                html_data
+            # Close any open dialogs in one call and give them a moment to go
+            dialog_close = "div[role=dialog] td > img:last-child"
+            closed = self.driver.execute_script(
+                "const icons = document.querySelectorAll(arguments[0]);"
+                "icons.forEach(el => el.click()); return icons.length",
+                dialog_close
             )
+            if closed:
+                try:
+                    WebDriverWait(self.driver, 0.5).until_not(
+                        ec.presence_of_element_located((By.CSS_SELECTOR, dialog_close))
+                    )
+                except TimeoutException:
+                    pass
             
-            time.sleep(2)
+            # Open the compose window, with the Bcc field for batches
+            fields = self.driver.execute_async_script(OPEN_COMPOSE_JS, len(to) > 1)
+            if not fields:
+                raise TimeoutException("Compose window cannot be opened.")
+            to_input, bcc_input = fields
             
-            # Send email
-            self.click_element("div[role=button][aria-label*=Ctrl-Enter]")
+            # A real Enter after each address turns it into a recipient chip.
+            # Batches go in Bcc with the sender in To, so recipients stay hidden
+            if bcc_input is None:
+                to_input.send_keys(to[0], Keys.ENTER)
+            else:
+                to_input.send_keys(self.email, Keys.ENTER)
+                for address in to:
+                    bcc_input.send_keys(address, Keys.ENTER)
             
-            # Wait for send button to disappear
-            wait_until(lambda: not self.find_elements(
-                "div[role=button][aria-label*=Ctrl-Enter]"
-            ))()
+            # Fill subject and body and send in a single driver call
+            composed = self.driver.execute_async_script(SEND_COMPOSED_JS, subject, body)
+            if not composed:
+                raise TimeoutException("Compose window cannot be sent.")
             
             # Verify email was sent
             email_sent = self.wait_until_email_sent(
@@ -571,71 +737,398 @@ class GmailAccount(BrowserHandler):
             )
             
             if not email_sent:
+                # Ctrl-C ended the wait, the email did not fail
+                if _SHUTDOWN.is_set():
+                    return False
                 raise TimeoutException("Email sent dialog cannot be detected.")
             
-            LOGGER.info(f"Email sent to {to} from {self.email}")
+            LOGGER.info(f"Email sent to {', '.join(to)} from {self.email}")
+            return True
             
         except COMMON_EXCEPTIONS:
+            # Failures while stopping are expected, not sending errors or limits
+            if _SHUTDOWN.is_set():
+                return False
+            
+            # Check for the daily limit notice while the failed page is still shown
+            try:
+                self.limit_reached = self.driver.execute_script(
+                    "return document.body.innerText.includes(arguments[0])", _LIMIT_REACHED_TEXT
+                )
+            except WebDriverException:
+                pass
+            
             logging_error_screenshot(
-                f"Error occurred while sending email to {to} from {self.email}", 
+                f"Error occurred while sending email to {', '.join(to)} from {self.email}", 
                 self.driver
             )
+            return False
+
+
+#################################################################################################
+# -----------------------------------SMTP Account Handler--------------------------------------#
+#################################################################################################
+
+class SmtpGmailAccount:
+    """
+    Gmail account handler that sends through Gmail's SMTP server.
+    
+    Used instead of GmailAccount for the email sending path when
+    [SMTP] use_smtp is enabled. One authenticated connection is kept open
+    per account and reused for every recipient, so no browser is started.
+    The password column must hold an App Password for the account.
+    """
+
+    def __init__(self, email, password, host="smtp.gmail.com", port=587):
+        """
+        Initialize SMTP account handler.
+        
+        Args:
+            email (str): Gmail address
+            password (str): App Password for the account
+            host (str): SMTP server host
+            port (int): SMTP server port (STARTTLS)
+        """
+        self.email = email
+        self.password = password
+        self.host = host
+        self.port = port
+        self.smtp = None
+        self.limit_reached = False
+
+    def login(self):
+        """
+        Open the SMTP connection and authenticate.
+        
+        Returns:
+            bool: True if login successful, False otherwise
+        """
+        try:
+            self.smtp = smtplib.SMTP(self.host, self.port, timeout=60)
+            self.smtp.starttls()
+            self.smtp.login(self.email, self.password)
+            return True
+        except (smtplib.SMTPException, OSError):
+            LOGGER.exception(f"Cannot login {self.email} over SMTP!")
+            self.kill_browser()
+            return False
+
+    def send_emails(self, to, subject, body):
+        """
+        Send one email to a batch of recipients.
+        
+        Args:
+            to (list): Recipient email addresses
+            subject (str): Email subject line
+            body (str): HTML content of the email
+            
+        Returns:
+            bool: True if email sent, False otherwise
+        """
+        try:
+            LOGGER.info(f"Sending email to {', '.join(to)} from {self.email}")
+            
+            message = EmailMessage()
+            message["From"] = self.email
+            message["To"] = self.email
+            message["Subject"] = subject
+            message.set_content(body, subtype="html")
+            
+            # Reconnect if an earlier reconnect failed
+            if self.smtp is None and not self.login():
+                return False
+            
+            # Recipients only go in the envelope, so a batch stays hidden from itself (Bcc)
+            try:
+                self.smtp.send_message(message, to_addrs=to)
+            except smtplib.SMTPServerDisconnected:
+                # Gmail drops idle connections, log in again and retry once
+                LOGGER.info(f"SMTP connection of {self.email} was closed, reconnecting")
+                self.kill_browser()
+                if not self.login():
+                    return False
+                self.smtp.send_message(message, to_addrs=to)
+            
+            LOGGER.info(f"Email sent to {', '.join(to)} from {self.email}")
+            return True
+            
+        except smtplib.SMTPResponseException as e:
+            # 5.4.5 is Gmail's daily sending limit
+            self.limit_reached = "5.4.5" in str(e)
+            LOGGER.exception(f"Error occurred while sending email to {', '.join(to)} from {self.email}")
+            return False
+        
+        except (smtplib.SMTPException, OSError):
+            LOGGER.exception(f"Error occurred while sending email to {', '.join(to)} from {self.email}")
+            return False
+
+    def kill_browser(self):
+        """
+        Close the SMTP connection.
+        
+        Named after BrowserHandler.kill_browser so callers can release
+        either kind of account the same way.
+        """
+        if self.smtp is None:
+            return
+        
+        try:
+            self.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self.smtp = None
 
 
 #################################################################################################
 # -----------------------------------Utility Functions-----------------------------------------#
 #################################################################################################
 
-def send_email(recipients, row):
+def send_email(settings, rows, bound, body, batches):
     """
-    Send emails to all recipients using specified Gmail account.
+    Send recipient batches from the shared queue until every one is handled.
+    
+    Runs once per sending thread, using the account bound to the thread by
+    bind_worker_account. A failed batch is put back for another try, up to
+    _SEND_ATTEMPTS. An account that reaches its daily limit is recorded,
+    closed and replaced with the next account row; its batch is put back
+    without counting the attempt. A thread left without an account stops,
+    so it never takes batches the other threads could send. The others keep
+    waiting while any batch is still being sent, since it may be put back.
     
     Args:
-        recipients (pandas.DataFrame): DataFrame containing recipient emails
-        row (pandas.Series): Row containing Gmail account information
+        settings (Settings): Resolved configuration
+        rows (queue.Queue): Account rows not logged in yet
+        bound (list): Every account bound so far, released after the run
+        body (str): HTML content of the email
+        batches (queue.Queue): (recipients, attempt) pairs left to send
     """
-    browser = add_gmail(row, False)
-    if browser is None:
-        return
+    while not _SHUTDOWN.is_set():
+        account = getattr(_WORKER, "account", None)
+        if account is None:
+            return
+        
+        # An empty queue is not the end while other threads still hold batches,
+        # they may put theirs back. Stop once every batch is marked done
+        try:
+            batch, attempt = batches.get(timeout=1)
+        except queue.Empty:
+            if not batches.unfinished_tasks:
+                return
+            continue
+        
+        try:
+            # Skip recipients already emailed in an earlier run
+            to = [recipient for recipient in batch if recipient not in sent_log]
+            if not to:
+                continue
+            
+            try:
+                sent = account.send_emails(to, settings.email_subject, body)
+            except Exception:
+                LOGGER.exception(f"Sending to {', '.join(to)} failed!")
+                sent = False
+            
+            if sent:
+                for recipient in to:
+                    record_sent(account.email, recipient)
+            
+            elif account.limit_reached:
+                record_limit_reached(account.email)
+                account.kill_browser()
+                batches.put((batch, attempt))
+                bind_worker_account(settings, rows, bound)
+            
+            # Requeue failed batches instead of holding up the others
+            elif attempt < _SEND_ATTEMPTS:
+                batches.put((batch, attempt + 1))
+            
+            elif not _SHUTDOWN.is_set():
+                LOGGER.error(f"Giving up on {', '.join(to)} after {attempt} attempts")
+        
+        finally:
+            # Put back batches were counted again by put(), so this only
+            # reaches zero once every batch is sent or given up
+            batches.task_done()
+
+def bind_worker_account(settings, rows, bound):
+    """
+    Log in the next account row and bind it to the current sending thread.
+    
+    Used as the sending executor's thread initializer, so each worker keeps
+    one account for the whole run, and again to replace an account that
+    reached its daily limit.
+    Accounts are only logged in when a thread needs one, so at most
+    parallel_browsers of them are in use at a time.
+    
+    Args:
+        settings (Settings): Resolved configuration
+        rows (queue.Queue): Account rows not logged in yet
+        bound (list): Every account bound so far, released after the run
+        
+    Returns:
+        GmailAccount | SmtpGmailAccount: Bound account or None if none are left
+    """
+    _WORKER.account = None
+    while not _SHUTDOWN.is_set():
+        try:
+            row = rows.get_nowait()
+        except queue.Empty:
+            break
+        
+        # Runs as the thread initializer, an exception here would break the executor
+        try:
+            account = login_account(settings, row)
+        except Exception:
+            LOGGER.exception(f"Account {row.email} failed!")
+            continue
+        
+        if account is not None:
+            with lock:
+                bound.append(account)
+            _WORKER.account = account
+            break
+    return _WORKER.account
+
+
+def login_account(settings, row):
+    """
+    Log in an account for sending, over SMTP or in a light-mode browser.
+    
+    Args:
+        settings (Settings): Resolved configuration
+        row (AccountRow): Account credentials
+        
+    Returns:
+        GmailAccount | SmtpGmailAccount: Logged in account or None if failed
+    """
+    if _SHUTDOWN.is_set():
+        return None
+    
+    # Checked before Chrome is started, accounts at their limit cannot send today
+    if row.email in limit_reached:
+        LOGGER.info(f"Skipping {row.email}, daily sending limit reached")
+        return None
+    
+    if settings.use_smtp:
+        return add_smtp_account(settings, row)
+    return add_gmail(settings, row, close=False, light_mode=True)
+
+
+def load_sent_log():
+    """
+    Load the recipients already emailed in earlier runs.
+    
+    Returns:
+        set: Recipient email addresses
+    """
+    if not os.path.exists(_SENT_LOG_FILE):
+        return set()
+    
+    with open(_SENT_LOG_FILE, "r", encoding="utf-8") as f:
+        return {line.split("\t", 1)[1] for line in f.read().splitlines() if "\t" in line}
+
+
+def record_sent(from_email, to_email):
+    """
+    Append a sent email to the sent log so reruns skip it.
+    
+    Args:
+        from_email (str): Gmail address the email was sent from
+        to_email (str): Recipient email address
+    """
+    with lock:
+        sent_log.add(to_email)
+        with open(_SENT_LOG_FILE, "a", encoding="utf-8") as f:
+            f.write(f"{from_email}\t{to_email}\n")
+
+
+def load_limit_log():
+    """
+    Load the accounts that reached their daily sending limit today.
+    
+    Returns:
+        set: Gmail addresses
+    """
+    if not os.path.exists(_LIMIT_TRACK_FILE):
+        return set()
+    
+    today = datetime.date.today().isoformat()
+    with open(_LIMIT_TRACK_FILE, "r", newline="", encoding="utf-8") as f:
+        return {row["Email"] for row in csv.DictReader(f) if row["Email"] and row["Date"] == today}
+
+
+def record_limit_reached(email):
+    """
+    Append an account that reached its daily sending limit to the limit log.
+    
+    Args:
+        email (str): Gmail address
+    """
+    with lock:
+        if email in limit_reached:
+            return
+        limit_reached.add(email)
+        
+        new_file = not os.path.exists(_LIMIT_TRACK_FILE)
+        with open(_LIMIT_TRACK_FILE, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(["Email", "Date"])
+            writer.writerow([email, datetime.date.today().isoformat()])
+        LOGGER.warning(f"Daily sending limit reached for {email}")
+
+
+def add_smtp_account(settings, row):
+    """
+    Create and login to Gmail account over SMTP.
     
-    # Send email to each recipient
-    recipients[_CONFIG["RECIPIENT"]["email_col"]].apply(
-        lambda rec: browser.send_emails(rec, _CONFIG["EMAIL_INFO"]["email_subject"])
+    Args:
+        settings (Settings): Resolved configuration
+        row (AccountRow): Account credentials
+        
+    Returns:
+        SmtpGmailAccount: Logged in SMTP account or None if failed
+    """
+    account = SmtpGmailAccount(
+        row.email,
+        row.password,
+        settings.smtp_host,
+        settings.smtp_port
     )
     
-    browser.kill_browser()
+    if not account.login():
+        return None
+    
+    return account
 
 
-def add_gmail(row, close=True):
+def add_gmail(settings, row, close=True, light_mode=False):
     """
     Create and login to Gmail account.
     
     Args:
-        row (pandas.Series): Row containing account information
+        settings (Settings): Resolved configuration
+        row (AccountRow): Account credentials
         close (bool): Whether to close browser after login
+        light_mode (bool): Start Chrome without images and unneeded subsystems
         
     Returns:
         GmailAccount: Logged in Gmail account or None if failed
     """
-    global _PORT
-    row = row[1]
-    
-    # Thread-safe port assignment
-    lock.acquire()
-    rec_col = _CONFIG["GMAIL_ACCOUNTS"]["recovery_email_col"]
+    # Only the port is shared between threads, Chrome starts run concurrently
     browser = GmailAccount(
-        row[_CONFIG["GMAIL_ACCOUNTS"]["email_col"]], 
-        row[_CONFIG["GMAIL_ACCOUNTS"]["pass_col"]], 
-        row[rec_col] if rec_col else "",
-        port=_PORT
+        row.email, 
+        row.password, 
+        row.recovery_email,
+        port=next(_PORT_SEQ),
+        light_mode=light_mode
     )
-    _PORT += 1
-    lock.release()
     
     # Attempt login
     logged_in = browser.login_gmail()
     
-    if close:
+    # A failed or interrupted login is never handed out, so close it here
+    if close or not logged_in:
         browser.kill_browser()
     
     if not logged_in:
@@ -644,45 +1137,217 @@ def add_gmail(row, close=True):
     return browser
 
 
-def parallel_browsing(func, op):
+def read_rows(path, start_index, end_index, columns):
+    """
+    Stream selected columns of a .csv or .xlsx sheet.
+    
+    CSV files are read with the csv module and workbooks are opened
+    read-only, so rows are parsed lazily instead of loading the whole
+    sheet into memory. Workbook rows outside the range are skipped by
+    openpyxl without building their values.
+    
+    Args:
+        path (str): Path to the .csv or .xlsx file
+        start_index (int): First data row to yield (0-based)
+        end_index (int): Last data row to yield, inclusive (-1 means till end)
+        columns (list): Column headers to read; an empty name reads as ""
+        
+    Yields:
+        tuple: Values of the requested columns, empty cells as ""
+    """
+    stop = None if end_index == -1 else end_index + 1
+    if path.lower().endswith(".csv"):
+        with open(path, "r", newline="", encoding="utf-8-sig") as f:
+            rows = csv.reader(f)
+            header = next(rows, ())
+            yield from _select_columns(path, header, itertools.islice(rows, start_index, stop), columns)
+        return
+    
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        header = next(sheet.iter_rows(max_row=1, values_only=True), ())
+        
+        # Sheet rows are 1-based and the header is row 1
+        rows = sheet.iter_rows(
+            min_row=start_index + 2,
+            max_row=None if stop is None else stop + 1,
+            values_only=True
+        )
+        yield from _select_columns(path, header, rows, columns)
+    finally:
+        workbook.close()
+
+
+def _select_columns(path, header, rows, columns):
+    """Yield the requested columns of rows, located by name in header."""
+    header = list(header)
+    positions = []
+    for column in columns:
+        if column and column not in header:
+            raise KeyError(f"Column '{column}' not found in {path}")
+        positions.append(header.index(column) if column else None)
+    
+    for values in rows:
+        yield tuple(
+            "" if pos is None or pos >= len(values) or values[pos] is None else str(values[pos])
+            for pos in positions
+        )
+
+
+def read_email_html(path):
+    """
+    Read the email HTML template and extract its body content.
+    
+    Called once per sending run; the result is shared by every worker.
+    
+    Args:
+        path (str): Path to the HTML template
+        
+    Returns:
+        str: Content between the <body> tags, or the whole file if absent
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        html_data = f.read()
+    
+    # Extract body content from HTML
+    _, _, rest = html_data.partition("<body>")
+    body, _, _ = rest.partition("</body>")
+    return body if body else html_data
+
+
+def parallel_browsing(settings, func, op):
     """
     Execute function in parallel across multiple Gmail accounts.
     
     Args:
+        settings (Settings): Resolved configuration, passed on to func
         func: Function to execute
         op (int): Operation type (1 for email sending, other for account management)
         
     Returns:
         Wrapped function for parallel execution
     """
-    # Load Gmail accounts data
-    file_data = pandas.read_excel(_CONFIG["GMAIL_ACCOUNTS"]["emails_excel_file"], index_col=False)
-    end_ind = (int(_CONFIG["GMAIL_ACCOUNTS"]["end_index"]) 
-              if int(_CONFIG["GMAIL_ACCOUNTS"]["end_index"]) != -1 
-              else len(file_data))
-    file_data = file_data.loc[int(_CONFIG["GMAIL_ACCOUNTS"]["start_index"]): end_ind]
+    # Load Gmail accounts data (streamed, rows are read as the pool consumes them)
+    file_data = (AccountRow(*values) for values in read_rows(
+        settings.emails_excel_file,
+        settings.start_index,
+        settings.end_index,
+        [settings.email_col, settings.pass_col, settings.recovery_email_col]
+    ))
+    
+    def run_per_account(executor, task):
+        """Run task for every account row, logging failures as they finish."""
+        futures = {executor.submit(task, row): row for row in file_data}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception:
+                LOGGER.exception(f"Account {futures[future].email} failed!")
     
     def wrapper(*args, **kwargs):
-        # Create thread pool for parallel processing
-        pool = ThreadPool(int(_CONFIG["BROWSER"]["parallel_browsers"]))
-        
-        if op == 1:  # Email sending operation
-            # Load recipients data
-            end_ind_r = (int(_CONFIG["RECIPIENT"]["end_index"]) 
-                        if int(_CONFIG["RECIPIENT"]["end_index"]) != -1 
-                        else len(recipients))
-            recipients = pandas.read_excel(_CONFIG["RECIPIENT"]["recipient_emails_excel"], index_col=False)
-            recipients = recipients.loc[int(_CONFIG["RECIPIENT"]["start_index"]): end_ind_r]
-            
-            # Execute function with recipients for each account
-            pool.map(partial(func, recipients), file_data.iterrows())
-        else:  # Account management operation
+        if op != 1:  # Account management operation
             # Execute function for each account
-            pool.map(func, file_data.iterrows())
+            with ThreadPoolExecutor(max_workers=settings.parallel_browsers) as executor:
+                for _ in run_per_account(executor, partial(func, settings)):
+                    pass
+            return
+        
+        # Email sending operation: read the template once, before any login,
+        # so a missing or unreadable file fails fast
+        body = read_email_html(settings.email_html_file)
+        
+        # Account rows are logged in by the sending threads as they need one
+        rows = queue.Queue()
+        for row in file_data:
+            rows.put(row)
+        if rows.empty():
+            LOGGER.error("No account rows in range, nothing sent.")
+            return
+        
+        # Load recipients data, dropping blanks and duplicates in original order
+        addresses = (email.strip().lower() for email, in read_rows(
+            settings.recipient_emails_excel,
+            settings.recipient_start,
+            settings.recipient_end,
+            [settings.recipient_email_col]
+        ))
+        addresses = list(dict.fromkeys(rec for rec in addresses if rec))
+        
+        # Split recipients in batches, each batch is sent as one email
+        batches = queue.Queue()
+        for start in range(0, len(addresses), settings.recipients_per_email):
+            batches.put((addresses[start:start + settings.recipients_per_email], 1))
+        
+        # One sending thread per account in use, each keeps its account for the whole run
+        bound = []
+        workers = min(settings.parallel_browsers, rows.qsize())
+        try:
+            with ThreadPoolExecutor(
+                max_workers=workers, initializer=bind_worker_account, initargs=(settings, rows, bound)
+            ) as sender:
+                futures = [
+                    sender.submit(func, settings, rows, bound, body, batches)
+                    for _ in range(workers)
+                ]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception:
+                        LOGGER.exception("Sending thread failed!")
+            
+            if not bound:
+                LOGGER.error("No account could be logged in, nothing sent.")
+            elif not batches.empty():
+                LOGGER.error(f"{batches.qsize()} batches left unsent, every account is used up.")
+        
+        finally:
+            # Release every account, also when Ctrl-C interrupts the run
+            for account in bound:
+                account.kill_browser()
     
     return wrapper
 
 
+def report_progress():
+    """
+    Show which waits are in progress, redrawn once per second.
+    
+    Runs in a single background thread so worker threads never write to
+    the terminal themselves. Identical messages are shown once with the
+    number of threads waiting on them.
+    """
+    dots = 0
+    shown = False
+    while not _SHUTDOWN.wait(1):
+        waiting = Counter(_WAITING.copy().values())
+        if not waiting:
+            if shown:
+                print("\x1b[2K\r", end="", flush=True)
+                shown = False
+            continue
+        
+        dots = dots % 3 + 1
+        status = ", ".join(
+            f"{message} ({count})" if count > 1 else message
+            for message, count in waiting.items()
+        )
+        print(f"\x1b[2K\r{status}{'.' * dots}", end="", flush=True)
+        shown = True
+
+
+def handle_interrupt(signum, frame):
+    """
+    Handle Ctrl-C: wake every waiting thread, then interrupt the main thread.
+    
+    Args:
+        signum (int): Signal number
+        frame: Current stack frame
+    """
+    _SHUTDOWN.set()
+    signal.default_int_handler(signum, frame)
+
+
 def logging_error_screenshot(message, driver):
     """
     Log error message and take screenshot for debugging.
@@ -691,18 +1356,52 @@ def logging_error_screenshot(message, driver):
         message (str): Error message to log
         driver: WebDriver instance for screenshot
     """
+    # Past the limit an error storm would only fill the disk with the same page
+    if next(_SCREENSHOT_COUNT) > _SCREENSHOT_LIMIT:
+        LOGGER.exception(message)
+        return
+    
     # Generate unique filename
-    image_name = datetime.datetime.now().strftime("%d%m%Y%H%M")
-    for _ in range(5):
-        image_name += random.choice(string.ascii_letters)
+    image_name = f"{datetime.datetime.now():%d%m%Y%H%M%S%f}_{secrets.token_hex(4)}"
+    extension = "png" if Image is None else "jpg"
+    image_path = os.path.abspath(f"{_FOLDER_CONTAINING_SCREENSHOTS}/{image_name}.{extension}")
     
-    # Save screenshot
-    image_path = os.path.abspath(f"{_FOLDER_CONTAINING_SCREENSHOTS}/{image_name}.png")
-    driver.save_screenshot(image_path)
+    # Capture now and decode/write the file in the background
+    try:
+        image_data = driver.execute_cdp_cmd("Page.captureScreenshot", {
+            "format": "png", "captureBeyondViewport": False, "optimizeForSpeed": True
+        })["data"]
+    except (AttributeError, WebDriverException):
+        # Driver without CDP support
+        image_data = driver.get_screenshot_as_base64()
+    _SCREENSHOT_WRITER.submit(write_screenshot, image_path, image_data)
     
     # Log error with screenshot path
     LOGGER.exception(f"{message} => file:///{image_path}")
-    driver.refresh()
+
+
+def write_screenshot(image_path, image_data):
+    """
+    Write captured screenshot data to disk.
+    
+    With Pillow installed the image is shrunk and saved as a JPEG,
+    otherwise the PNG is written as captured.
+    
+    Args:
+        image_path (str): Destination file path
+        image_data (str): Base64 encoded PNG image data
+    """
+    try:
+        if Image is None:
+            with open(image_path, "wb") as f:
+                f.write(base64.b64decode(image_data))
+            return
+        
+        image = Image.open(io.BytesIO(base64.b64decode(image_data))).convert("RGB")
+        image.thumbnail((1024, 1024))
+        image.save(image_path, "JPEG", quality=75, optimize=True)
+    except OSError:
+        LOGGER.exception(f"Cannot save screenshot {image_path}")
 
 
 ######################################################################################
@@ -714,14 +1413,23 @@ if __name__ == "__main__":
         # Initialize global lock for thread safety
         lock = Lock()
         
+        # Resolve configuration once
+        settings = Settings.from_config(_CONFIG)
+        
+        # Ctrl-C stops every worker at its next wait instead of after it
+        signal.signal(signal.SIGINT, handle_interrupt)
+        if _IS_TTY:
+            Thread(target=report_progress, daemon=True).start()
+        
         # Create necessary directories
         os.makedirs(_FOLDER_CONTAINING_ALL_PROFILES, exist_ok=True)
         os.makedirs(_FOLDER_CONTAINING_SCREENSHOTS, exist_ok=True)
         
-        # Initialize daily limit tracking
-        limit_reached_rec = pandas.DataFrame(columns=["Email"])
-        if os.path.exists(_LIMIT_TRACK_FILE):
-            limit_reached_rec = pandas.read_excel(_LIMIT_TRACK_FILE, index_col=False).fillna("")
+        # Load emails already sent so reruns resume where they stopped
+        sent_log = load_sent_log()
+        
+        # Load accounts already at their daily sending limit
+        limit_reached = load_limit_log()
         
         # Display menu and get user selection
         menu = {"Add Gmail": add_gmail, "Send Emails": send_email}
@@ -729,7 +1437,7 @@ if __name__ == "__main__":
         selected_option = cutie.select(menu_list)
         
         # Execute selected operation
-        parallel_browsing(menu[menu_list[selected_option]], selected_option)()
+        parallel_browsing(settings, menu[menu_list[selected_option]], selected_option)()
         
     except Exception as e:
         LOGGER.exception("Critical Error Occurred!")